@@ -4,16 +4,49 @@ UQAP API Server
 Provides metrics endpoint for dashboard
 """
 
+import functools
 import json
+import threading
 import time
 from pathlib import Path
 from flask import Flask, jsonify, request
-from flask_cors import CORS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
-CORS(app)
+
+
+@app.after_request
+def add_cors(resp):
+    """Attach the wildcard CORS header directly.
+
+    flask_cors runs origin-matching Python on every response; for this
+    read-only metrics API a single static header assignment is all the
+    dashboard needs.
+    """
+    resp.headers["Access-Control-Allow-Origin"] = "*"
+    return resp
+
+
+def _json_response(payload: dict):
+    """Serialize payload to a JSON response, via orjson when available"""
+    if orjson is not None:
+        return app.response_class(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
 
 # Metrics storage
+COUNTER_KEYS = frozenset({
+    "total_requests",
+    "successful_requests",
+    "failed_requests",
+    "total_tests_run",
+    "tests_passed",
+    "tests_failed",
+})
+
 metrics = {
     "total_requests": 0,
     "successful_requests": 0,
@@ -26,6 +59,21 @@ metrics = {
 }
 
 start_time = time.time()
+metrics_lock = threading.Lock()
+
+# /metrics response cache: polling dashboards hammer this endpoint but the
+# counters only move on POST, so the serialized blob is reused for 100ms and
+# dropped eagerly whenever an update or reset lands.
+_METRICS_TTL = 0.1
+_cached_blob = None
+_cached_at = 0.0
+
+
+def _serialize(payload: dict) -> bytes:
+    """Serialize payload to JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
 
 @app.route('/health', methods=['GET'])
 def health():
@@ -35,61 +83,89 @@ def health():
 @app.route('/metrics', methods=['GET'])
 def get_metrics():
     """Get current metrics"""
+    global _cached_blob, _cached_at
+    now = time.monotonic()
+    if _cached_blob is not None and now - _cached_at < _METRICS_TTL:
+        return app.response_class(_cached_blob, mimetype='application/json'), 200
+
     metrics["uptime_seconds"] = int(time.time() - start_time)
     metrics["last_update"] = time.time()
-    return jsonify(metrics), 200
+    _cached_blob = _serialize(metrics)
+    _cached_at = now
+    return app.response_class(_cached_blob, mimetype='application/json'), 200
 
 @app.route('/metrics/update', methods=['POST'])
 def update_metrics():
     """Update metrics (called by demo script)"""
     global metrics
     data = request.get_json() or {}
-    
-    if "total_requests" in data:
-        metrics["total_requests"] += data.get("total_requests", 0)
-    if "successful_requests" in data:
-        metrics["successful_requests"] += data.get("successful_requests", 0)
-    if "failed_requests" in data:
-        metrics["failed_requests"] += data.get("failed_requests", 0)
-    if "total_tests_run" in data:
-        metrics["total_tests_run"] += data.get("total_tests_run", 0)
-    if "tests_passed" in data:
-        metrics["tests_passed"] += data.get("tests_passed", 0)
-    if "tests_failed" in data:
-        metrics["tests_failed"] += data.get("tests_failed", 0)
-    
-    metrics["last_update"] = time.time()
-    return jsonify({"status": "updated", "metrics": metrics}), 200
+
+    # Fold all counter increments into a single C-level dict.update instead
+    # of six Python-level lookup/add branches; non-counter or non-numeric
+    # keys are ignored. The lock keeps increments atomic under a threaded
+    # server.
+    increments = {
+        k: v for k, v in data.items()
+        if k in COUNTER_KEYS and isinstance(v, (int, float))
+    }
+    global _cached_at
+    with metrics_lock:
+        metrics.update({k: metrics[k] + v for k, v in increments.items()})
+        metrics["last_update"] = time.time()
+        _cached_at = 0.0  # drop the cached /metrics blob
+
+    return _json_response({"status": "updated", "metrics": metrics}), 200
 
 @app.route('/metrics/reset', methods=['POST'])
 def reset_metrics():
     """Reset all metrics"""
-    global metrics, start_time
-    start_time = time.time()
-    metrics = {
-        "total_requests": 0,
-        "successful_requests": 0,
-        "failed_requests": 0,
-        "total_tests_run": 0,
-        "tests_passed": 0,
-        "tests_failed": 0,
-        "uptime_seconds": 0,
-        "last_update": time.time()
-    }
-    return jsonify({"status": "reset", "metrics": metrics}), 200
+    global metrics, start_time, _cached_at
+    with metrics_lock:
+        start_time = time.time()
+        metrics = {
+            "total_requests": 0,
+            "successful_requests": 0,
+            "failed_requests": 0,
+            "total_tests_run": 0,
+            "tests_passed": 0,
+            "tests_failed": 0,
+            "uptime_seconds": 0,
+            "last_update": time.time()
+        }
+        _cached_at = 0.0  # drop the cached /metrics blob
+    return _json_response({"status": "reset", "metrics": metrics}), 200
+
+@functools.cache
+def _load_cfg(key: tuple) -> dict:
+    """Parse the config file, memoized on (path, mtime_ns).
+
+    Reload tests restart this entry point repeatedly; keying on mtime makes
+    re-parsing free while the file is unchanged. orjson skips the text-mode
+    decoder when available.
+    """
+    data = Path(key[0]).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 if __name__ == '__main__':
     config_path = Path(__file__).parent.parent.parent / "config" / "api_config.json"
-    if config_path.exists():
-        with open(config_path) as f:
-            config = json.load(f)
-            host = config.get("host", "localhost")
-            port = config.get("port", 8000)
-            debug = config.get("debug", True)
-    else:
+    try:
+        config = _load_cfg((str(config_path), config_path.stat().st_mtime_ns))
+        host = config.get("host", "localhost")
+        port = config.get("port", 8000)
+        debug = config.get("debug", True)
+    except OSError:
         host = "0.0.0.0"
         port = 8000
         debug = True
     
     print(f"🚀 Starting API server on {host}:{port}")
-    app.run(host=host, port=port, debug=False, use_reloader=False)
+    try:
+        # Werkzeug's dev server handles one request at a time; waitress gives
+        # a threaded accept loop with HTTP/1.1 keep-alive for the poll traffic.
+        from waitress import serve
+        serve(app, host=host, port=port, threads=8, connection_limit=1000)
+    except ImportError:
+        app.run(host=host, port=port, debug=False, use_reloader=False)
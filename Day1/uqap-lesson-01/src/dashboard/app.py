@@ -4,113 +4,43 @@ UQAP Dashboard
 Displays real-time metrics from API
 """
 
+import gzip
+import hashlib
 import json
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from pathlib import Path
-from flask import Flask, render_template_string
+from flask import Flask, Response, request
 from flask_cors import CORS
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 app = Flask(__name__)
 CORS(app)
 
+# One pooled session for all upstream calls: keep-alive skips the TCP
+# handshake on every metrics refresh and the retry policy absorbs blips.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
 # Dashboard HTML Template
-DASHBOARD_HTML = """
+DASHBOARD_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>UQAP Dashboard</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        h1 {
-            color: white;
-            text-align: center;
-            margin-bottom: 30px;
-            font-size: 2.5em;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        .metrics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        .metric-card {
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease;
-        }
-        .metric-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 6px 12px rgba(0,0,0,0.15);
-        }
-        .metric-label {
-            font-size: 0.9em;
-            color: #666;
-            margin-bottom: 10px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        .metric-value {
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-        }
-        .metric-value.zero {
-            color: #999;
-        }
-        .status {
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        .status-indicator {
-            display: inline-block;
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        .status-indicator.online {
-            background: #10b981;
-        }
-        .status-indicator.offline {
-            background: #ef4444;
-        }
-        .last-update {
-            color: #666;
-            font-size: 0.9em;
-            margin-top: 10px;
-        }
-        .error-message {
-            background: #fee;
-            color: #c33;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-            border-left: 4px solid #c33;
-        }
-    </style>
+    <link rel="stylesheet" href="__CSS_URL__">
 </head>
 <body>
     <div class="container">
@@ -157,86 +87,193 @@ DASHBOARD_HTML = """
         </div>
     </div>
 
-    <script>
-        const METRICS_ENDPOINT = 'http://localhost:8000/metrics';
-        const REFRESH_INTERVAL = 2000; // 2 seconds (faster refresh)
-
-        function updateMetrics() {
-            // Add cache-busting parameter to prevent caching
-            const url = METRICS_ENDPOINT + '?t=' + Date.now();
-            
-            fetch(url, {
-                method: 'GET',
-                headers: {
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache'
-                },
-                cache: 'no-store'
-            })
-                .then(response => {
-                    if (!response.ok) throw new Error('Network response was not ok');
-                    return response.json();
-                })
-                .then(data => {
-                    // Update status
-                    document.getElementById('statusIndicator').className = 'status-indicator online';
-                    document.getElementById('statusText').textContent = 'API Online';
-                    
-                    // Clear error
-                    document.getElementById('errorContainer').innerHTML = '';
-                    
-                    // Update metrics - ensure we use the actual values from API
-                    updateMetric('totalRequests', parseInt(data.total_requests) || 0);
-                    updateMetric('successfulRequests', parseInt(data.successful_requests) || 0);
-                    updateMetric('failedRequests', parseInt(data.failed_requests) || 0);
-                    updateMetric('totalTestsRun', parseInt(data.total_tests_run) || 0);
-                    updateMetric('testsPassed', parseInt(data.tests_passed) || 0);
-                    updateMetric('testsFailed', parseInt(data.tests_failed) || 0);
-                    updateMetric('uptime', parseInt(data.uptime_seconds) || 0);
-                    
-                    // Update last update time
-                    const lastUpdate = new Date(data.last_update * 1000);
-                    document.getElementById('lastUpdate').textContent = 
-                        `Last updated: ${lastUpdate.toLocaleTimeString()}`;
-                })
-                .catch(error => {
-                    document.getElementById('statusIndicator').className = 'status-indicator offline';
-                    document.getElementById('statusText').textContent = 'API Offline';
-                    document.getElementById('errorContainer').innerHTML = 
-                        `<div class="error-message">Error: ${error.message}. Make sure the API server is running on port 8000.</div>`;
-                    console.error('Metrics fetch error:', error);
-                });
-        }
-
-        function updateMetric(id, value) {
-            const element = document.getElementById(id);
-            element.textContent = value.toLocaleString();
-            
-            // Remove zero class if value is not zero
-            if (value > 0) {
-                element.classList.remove('zero');
-            } else {
-                element.classList.add('zero');
-            }
-        }
-
-        // Initial load immediately
-        updateMetrics();
-        
-        // Force immediate refresh after a short delay
-        setTimeout(updateMetrics, 500);
-        
-        // Auto-refresh
-        setInterval(updateMetrics, REFRESH_INTERVAL);
-    </script>
+    <script src="__JS_URL__" defer></script>
 </body>
 </html>
 """
 
+METRICS_UPSTREAM = 'http://localhost:8000/metrics'
+EVENT_POLL_INTERVAL = 1.0   # server-side upstream check cadence
+KEEPALIVE_INTERVAL = 30.0   # comment frames so proxies keep the stream open
+
+# Counters that constitute a "real" change; uptime/last_update tick every
+# second and would defeat change detection.
+_COUNTER_KEYS = (
+    "total_requests", "successful_requests", "failed_requests",
+    "total_tests_run", "tests_passed", "tests_failed",
+)
+
+
+class _MetricsFetcher:
+    """One background poller shared by every /events client.
+
+    Without this, each connected dashboard tab would run its own upstream
+    fetch loop, multiplying API load by the number of clients. A single
+    daemon thread polls once per interval and fans the result out through
+    a Condition, so upstream QPS stays constant regardless of fan-out.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._payload = None
+        self._delta = None
+        self._signature = None
+        self._generation = 0
+        self._thread = None
+
+    def start(self):
+        """Start the poller thread on first use (idempotent)"""
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                payload = SESSION.get(METRICS_UPSTREAM, timeout=2).json()
+                signature = tuple(payload.get(k) for k in _COUNTER_KEYS)
+            except (requests.RequestException, ValueError):
+                payload = {"api_offline": True}
+                signature = "offline"
+
+            if signature != self._signature:
+                # Delta encoding: only keys whose value moved since the last
+                # push go over the wire; new clients still get a full frame.
+                previous = self._payload or {}
+                delta = {k: v for k, v in payload.items()
+                         if previous.get(k) != v}
+                with self._cond:
+                    self._payload = payload
+                    self._delta = delta
+                    self._signature = signature
+                    self._generation += 1
+                    self._cond.notify_all()
+
+            time.sleep(EVENT_POLL_INTERVAL)
+
+    def wait_for_change(self, seen_generation: int, timeout: float):
+        """Block until a new payload lands or timeout elapses"""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._generation != seen_generation, timeout
+            )
+            return self._generation, self._payload, self._delta
+
+
+_FETCHER = _MetricsFetcher()
+
+
+def _event_stream():
+    """Yield an SSE frame whenever the shared fetcher sees a change."""
+    _FETCHER.start()
+    generation = 0
+    while True:
+        new_generation, payload, delta = _FETCHER.wait_for_change(
+            generation, KEEPALIVE_INTERVAL
+        )
+        if new_generation == generation:
+            yield ":\n\n"
+        else:
+            # A delta only describes the latest generation. If the fetcher
+            # advanced more than one step while this generator was blocked
+            # in a socket write (slow client), the skipped updates are gone
+            # — resync with a full payload instead. This also covers the
+            # first frame, where the client has no baseline yet.
+            body = delta if new_generation == generation + 1 else payload
+            generation = new_generation
+            yield f"data: {json.dumps(body)}\n\n"
+
+
+# /metrics proxy cache: a burst of tabs refreshing at once shares one
+# upstream request. The lock makes the refill single-flight; readers on the
+# fast path never take it. cachetools would do the same but is not a dep.
+_PROXY_TTL = 0.5
+_proxy_lock = threading.Lock()
+_proxy_payload = None
+_proxy_at = 0.0
+
+
+@app.route('/metrics')
+def metrics_proxy():
+    """Proxy upstream metrics, absorbing polling bursts behind a short TTL"""
+    global _proxy_payload, _proxy_at
+    now = time.monotonic()
+    if _proxy_payload is not None and now - _proxy_at < _PROXY_TTL:
+        return Response(_proxy_payload, mimetype='application/json')
+
+    with _proxy_lock:
+        now = time.monotonic()
+        if _proxy_payload is None or now - _proxy_at >= _PROXY_TTL:
+            try:
+                _proxy_payload = SESSION.get(METRICS_UPSTREAM, timeout=2).content
+            except requests.RequestException:
+                return Response(b'{"api_offline": true}',
+                                mimetype='application/json', status=502)
+            _proxy_at = time.monotonic()
+    return Response(_proxy_payload, mimetype='application/json')
+
+
+@app.route('/events')
+def events():
+    """Push metrics to connected dashboards over Server-Sent Events"""
+    return Response(_event_stream(), mimetype='text/event-stream')
+
+
+# CSS/JS live as real static files so browsers cache them independently of
+# the page; a content-hash query string busts that cache on deploy while
+# send_file_max_age_default keeps the far-future expiry honest.
+_STATIC_DIR = Path(__file__).parent / "static"
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+
+
+def _asset_url(name: str) -> str:
+    digest = hashlib.md5((_STATIC_DIR / name).read_bytes()).hexdigest()[:8]
+    return f"/static/{name}?v={digest}"
+
+
+DASHBOARD_HTML = (
+    DASHBOARD_TEMPLATE
+    .replace("__CSS_URL__", _asset_url("dashboard.css"))
+    .replace("__JS_URL__", _asset_url("dashboard.js"))
+)
+
+# The template has no variables, so render it exactly once: encode at import,
+# hash for a strong ETag, and let repeat visitors ride on 304s.
+_RENDERED = DASHBOARD_HTML.encode('utf-8')
+_ETAG = hashlib.md5(_RENDERED).hexdigest()
+
+# Precompressed variants: the page is ~7 KB of redundant CSS/JS that
+# compresses 4-6x, and compressing at import means zero per-request CPU.
+_GZ = gzip.compress(_RENDERED, 9)
+_BR = brotli.compress(_RENDERED, quality=11) if brotli is not None else None
+
+
 @app.route('/')
 def dashboard():
-    """Render dashboard"""
-    return render_template_string(DASHBOARD_HTML)
+    """Serve the pre-rendered dashboard page"""
+    if request.headers.get('If-None-Match') == _ETAG:
+        return '', 304
+
+    body = _RENDERED
+    encoding = None
+    accepted = request.accept_encodings
+    if _BR is not None and accepted.quality('br'):
+        body, encoding = _BR, 'br'
+    elif accepted.quality('gzip'):
+        body, encoding = _GZ, 'gzip'
+
+    headers = {
+        'ETag': _ETAG,
+        'Cache-Control': 'public, max-age=3600',
+        'Vary': 'Accept-Encoding',
+    }
+    if encoding is not None:
+        headers['Content-Encoding'] = encoding
+    # direct_passthrough hands Werkzeug the bytes object as-is — no
+    # re-iteration or chunking of a body we already hold in one piece.
+    return Response(body, mimetype='text/html', headers=headers,
+                    direct_passthrough=True)
 
 if __name__ == '__main__':
     config_path = Path(__file__).parent.parent.parent / "config" / "dashboard_config.json"
@@ -250,4 +287,11 @@ if __name__ == '__main__':
         port = 8080
     
     print(f"🚀 Starting Dashboard on {host}:{port}")
-    app.run(host=host, port=port, debug=False, use_reloader=False)
+    try:
+        # Werkzeug's dev server is single-threaded, so one open /events
+        # stream would block every other client; waitress serves them
+        # concurrently with HTTP/1.1 keep-alive.
+        from waitress import serve
+        serve(app, host=host, port=port, threads=16, channel_timeout=120)
+    except ImportError:
+        app.run(host=host, port=port, debug=False, use_reloader=False)
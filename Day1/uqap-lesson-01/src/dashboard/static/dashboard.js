@@ -0,0 +1,119 @@
+const METRICS_ENDPOINT = '/metrics';  // dashboard proxy; TTL-cached server-side
+
+// Look every element up once; per-tick DOM queries add up across tabs.
+const IDS = ['totalRequests', 'successfulRequests', 'failedRequests',
+             'totalTestsRun', 'testsPassed', 'testsFailed', 'uptime',
+             'statusIndicator', 'statusText', 'errorContainer', 'lastUpdate'];
+const els = Object.fromEntries(IDS.map(id => [id, document.getElementById(id)]));
+const last = {};
+
+const FIELD_MAP = {
+    total_requests: 'totalRequests',
+    successful_requests: 'successfulRequests',
+    failed_requests: 'failedRequests',
+    total_tests_run: 'totalTestsRun',
+    tests_passed: 'testsPassed',
+    tests_failed: 'testsFailed',
+    uptime_seconds: 'uptime',
+};
+
+// Applies either a full payload or a server-side delta: only the
+// keys present in the frame are touched.
+function renderMetrics(data) {
+    // Update status
+    els.statusIndicator.className = 'status-indicator online';
+    els.statusText.textContent = 'API Online';
+
+    // Clear error
+    els.errorContainer.innerHTML = '';
+
+    for (const [key, value] of Object.entries(data)) {
+        if (key === 'last_update') {
+            const lastUpdate = new Date(value * 1000);
+            els.lastUpdate.textContent =
+                `Last updated: ${lastUpdate.toLocaleTimeString()}`;
+        } else if (FIELD_MAP[key]) {
+            updateMetric(FIELD_MAP[key], parseInt(value) || 0);
+        }
+    }
+}
+
+function showOffline(message) {
+    els.statusIndicator.className = 'status-indicator offline';
+    els.statusText.textContent = 'API Offline';
+    els.errorContainer.innerHTML =
+        `<div class="error-message">Error: ${message}. Make sure the API server is running on port 8000.</div>`;
+}
+
+// Manual refresh: one direct fetch against the API
+function updateMetrics() {
+    return fetch(METRICS_ENDPOINT)
+        .then(response => {
+            if (!response.ok) throw new Error('Network response was not ok');
+            return response.json();
+        })
+        .then(renderMetrics)
+        .catch(error => {
+            showOffline(error.message);
+            console.error('Metrics fetch error:', error);
+            throw error;
+        });
+}
+
+function updateMetric(id, value) {
+    // Unchanged values touch nothing — no text write, no layout work.
+    if (last[id] === value) return;
+    last[id] = value;
+    const element = els[id];
+    element.textContent = value.toLocaleString();
+    element.classList.toggle('zero', value === 0);
+}
+
+// Fallback polling with adaptive backoff: only runs while the event
+// stream is down, doubles its delay on failure (max 30s), resets to
+// 2s on success, and never starts a tick while one is in flight.
+let streamUp = false;
+let delay = 2000;
+let inFlight = false;
+
+function schedule() {
+    setTimeout(tick, delay);
+}
+
+async function tick() {
+    if (streamUp) return;          // stream recovered; stop polling
+    if (inFlight) return schedule();
+    inFlight = true;
+    try {
+        await updateMetrics();
+        delay = 2000;
+    } catch {
+        delay = Math.min(delay * 2, 30000);
+    } finally {
+        inFlight = false;
+        if (!streamUp) schedule();
+    }
+}
+
+// Server push: the dashboard backend streams a frame only when the
+// counters actually change, so idle tabs generate no requests at all.
+const es = new EventSource('/events');
+es.onopen = () => { streamUp = true; };
+es.onmessage = (e) => {
+    const data = JSON.parse(e.data);
+    if (data.api_offline) {
+        showOffline('upstream API unreachable');
+        return;
+    }
+    renderMetrics(data);
+};
+es.onerror = () => {
+    showOffline('event stream disconnected');
+    if (streamUp) {
+        streamUp = false;
+        schedule();
+    }
+};
+
+// Initial paint while the event stream connects
+updateMetrics();
@@ -4,20 +4,50 @@ Lesson 2: Deep Dictionary Comparison with Custom Assertions
 Generates a complete workspace for learning production-grade assertion logic.
 """
 
+import os
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from math import isclose
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Any
 import json
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared pool for parallel subtree diffs; created on first use so scripts
+# that never hit the parallel path pay nothing.
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+# Heuristics gating the parallel path: small payloads stay on the serial
+# fast path where thread handoff would only add overhead.
+_PARALLEL_MIN_SHARED = 8
+_PARALLEL_MIN_CHILDREN = 64
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+    return _EXECUTOR
+
 # ============================================================================
 # PHASE 1: DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Difference:
-    """Represents a single mismatch between expected and actual values."""
+    """Represents a single mismatch between expected and actual values.
+
+    slots=True drops the per-instance __dict__: large comparisons can emit
+    thousands of these, and the fixed layout roughly halves their footprint.
+    """
     path: str
     expected: Any
     actual: Any
@@ -72,7 +102,9 @@ class DictComparator:
     """
     
     def __init__(self, exclude_keys: set[str] | None = None, tolerance: float = 0.0):
-        self.exclude_keys = exclude_keys or set()
+        # Normalize to a real set: the set-algebra passes below need set
+        # operands, and callers pass lists (see the docstring example)
+        self.exclude_keys = set(exclude_keys) if exclude_keys else set()
         self.tolerance = tolerance  # For floating point comparisons
         self.differences: list[Difference] = []
     
@@ -87,122 +119,258 @@ class DictComparator:
         Raises:
             DictMismatchError: If dictionaries don't match
         """
-        self.differences = []  # Reset for new comparison
-        self._compare_dicts(expected, actual, path="root")
-        
+        self.reset()  # Reset for new comparison
+
+        big_keys = self._large_subtree_keys(expected, actual)
+        if len(big_keys) >= 2:
+            self._compare_parallel(expected, actual, big_keys)
+        else:
+            self._compare_dicts(expected, actual, path="root")
+
         if self.differences:
-            raise DictMismatchError(self.differences)
+            # Copy so a reused comparator's reset() cannot mutate the list
+            # the raised error is carrying.
+            raise DictMismatchError(list(self.differences))
+
+    def reset(self) -> None:
+        """Clear collected differences, keeping the list's allocation.
+
+        clear() reuses the underlying array, so a comparator recycled
+        across thousands of assertions stops churning the allocator.
+        """
+        self.differences.clear()
+
+    def _large_subtree_keys(self, expected: dict, actual: dict) -> list:
+        """Shared keys whose subtrees are big enough to diff in parallel."""
+        shared = (expected.keys() & actual.keys()) - self.exclude_keys
+        if len(shared) < _PARALLEL_MIN_SHARED:
+            return []
+        return [
+            key for key in shared
+            if type(expected[key]) is type(actual[key])
+            and isinstance(expected[key], (dict, list))
+            and len(expected[key]) >= _PARALLEL_MIN_CHILDREN
+        ]
+
+    def _compare_parallel(self, expected: dict, actual: dict, big_keys: list) -> None:
+        """Diff large top-level subtrees across the shared thread pool.
+
+        Root subtrees are independent, so each big one gets its own worker
+        comparator while the remainder is diffed serially on this thread;
+        results are concatenated at the end.
+        """
+        big = set(big_keys)
+        futures = [
+            _get_executor().submit(
+                self._diff_subtree, expected[key], actual[key], f"root.{key}"
+            )
+            for key in big_keys
+        ]
+
+        rest_expected = {k: v for k, v in expected.items() if k not in big}
+        rest_actual = {k: v for k, v in actual.items() if k not in big}
+        self._compare_dicts(rest_expected, rest_actual, path="root")
+
+        for future in futures:
+            self.differences.extend(future.result())
+
+    def _diff_subtree(self, expected, actual, path: str) -> list:
+        """Diff one subtree in isolation and return its differences."""
+        worker = DictComparator(set(self.exclude_keys), self.tolerance)
+        worker._compare_dicts(expected, actual, path)
+        return worker.differences
     
     def _compare_dicts(self, expected: dict, actual: dict, path: str) -> None:
-        """Recursively compare two dictionaries."""
-        # Find missing keys (in expected but not actual)
-        for key in expected:
-            if key in self.exclude_keys:
+        """Compare two dictionaries iteratively with an explicit work stack.
+
+        Each recursion level used to cost a Python call frame and risked
+        RecursionError on deep JSON; frames of (expected, actual, path) on a
+        deque replace the call stack entirely.
+        """
+        self._drain(deque([(expected, actual, (path,))]))
+
+    def _compare_lists(self, expected: list, actual: list, path: str) -> None:
+        """Compare two lists element by element."""
+        self._drain(deque([(expected, actual, (path,))]))
+
+    def _drain(self, stack: deque) -> None:
+        """Process comparison frames until the work stack is empty.
+
+        Every name used inside the loop is bound to a local first: LOAD_FAST
+        is the closest pure Python gets to compiled locals, and this loop is
+        all interpreter dispatch.
+        """
+        append = self.differences.append  # bound once; hot loops below
+        exclude = self.exclude_keys
+        tolerance = self.tolerance
+        push = stack.append
+        make_diff = Difference
+        is_instance = isinstance
+        join = "".join  # paths live as tuples; the dotted string is built
+        # only when a Difference is actually recorded
+
+        while stack:
+            expected, actual, parts = stack.pop()
+
+            if is_instance(expected, list):
+                if len(expected) != len(actual):
+                    append(
+                        make_diff(
+                            path=join(parts) + ".length",
+                            expected=len(expected),
+                            actual=len(actual),
+                            type="value_mismatch"
+                        )
+                    )
+                    # Continue comparing up to the shorter length
+                elif (np is not None and expected
+                        and all(type(x) is float for x in expected)
+                        and all(type(x) is float for x in actual)):
+                    # Float-only lists (metrics arrays) compare in one
+                    # vectorized pass instead of a per-element loop. The
+                    # comparison stays exact — list elements never had
+                    # tolerance applied — and the path is float-only
+                    # because float64 cannot represent ints above 2**53,
+                    # so int-bearing lists take the exact loop below.
+                    mismatched = np.flatnonzero(
+                        np.asarray(expected) != np.asarray(actual)
+                    )
+                    for i in mismatched:
+                        append(
+                            make_diff(
+                                path=f"{join(parts)}[{i}]",
+                                expected=expected[i],
+                                actual=actual[i],
+                                type="value_mismatch"
+                            )
+                        )
+                    continue
+                for i in range(min(len(expected), len(actual))):
+                    exp_item = expected[i]
+                    act_item = actual[i]
+                    if exp_item is act_item:
+                        continue
+
+                    if is_instance(exp_item, dict) and is_instance(act_item, dict):
+                        push((exp_item, act_item, parts + (f"[{i}]",)))
+                    elif is_instance(exp_item, list) and is_instance(act_item, list):
+                        push((exp_item, act_item, parts + (f"[{i}]",)))
+                    elif exp_item != act_item:
+                        append(
+                            make_diff(
+                                path=f"{join(parts)}[{i}]",
+                                expected=exp_item,
+                                actual=act_item,
+                                type="value_mismatch"
+                            )
+                        )
                 continue
-            if key not in actual:
-                self.differences.append(
-                    Difference(
-                        path=f"{path}.{key}",
+
+            # One round of set algebra replaces four passes of per-key `in`
+            # tests: dict views subtract and intersect at C level, so each key
+            # is hashed once instead of up to four times.
+            expected_keys = expected.keys()
+            actual_keys = actual.keys()
+
+            for key in expected_keys - actual_keys - exclude:
+                append(
+                    make_diff(
+                        path=f"{join(parts)}.{key}",
                         expected=expected[key],
                         actual="<missing>",
                         type="missing_key"
                     )
                 )
-        
-        # Find extra keys (in actual but not expected)
-        for key in actual:
-            if key in self.exclude_keys:
-                continue
-            if key not in expected:
-                self.differences.append(
-                    Difference(
-                        path=f"{path}.{key}",
+
+            for key in actual_keys - expected_keys - exclude:
+                append(
+                    make_diff(
+                        path=f"{join(parts)}.{key}",
                         expected="<missing>",
                         actual=actual[key],
                         type="extra_key"
                     )
                 )
-        
-        # Compare shared keys
-        for key in expected:
-            if key not in actual or key in self.exclude_keys:
-                continue
-            
-            exp_val = expected[key]
-            act_val = actual[key]
-            new_path = f"{path}.{key}"
-            
-            # Type mismatch
-            if type(exp_val) != type(act_val):
-                self.differences.append(
-                    Difference(
-                        path=new_path,
-                        expected=f"{exp_val} (type: {type(exp_val).__name__})",
-                        actual=f"{act_val} (type: {type(act_val).__name__})",
-                        type="type_mismatch"
+
+            # Compare shared keys
+            for key in (expected_keys & actual_keys) - exclude:
+                exp_val = expected[key]
+                act_val = actual[key]
+
+                # Same object means the whole subtree is equal; shared
+                # references are common when fixtures are built from one
+                # template, and this skips their entire walk.
+                if exp_val is act_val:
+                    continue
+
+                # Class identity is one pointer compare; two type() calls
+                # plus != cost about twice as much. It also feeds the
+                # monomorphic dispatch below without an MRO walk.
+                exp_cls = exp_val.__class__
+                act_cls = act_val.__class__
+
+                # Type mismatch
+                if exp_cls is not act_cls:
+                    append(
+                        make_diff(
+                            path=f"{join(parts)}.{key}",
+                            expected=f"{exp_val} (type: {exp_cls.__name__})",
+                            actual=f"{act_val} (type: {act_cls.__name__})",
+                            type="type_mismatch"
+                        )
                     )
-                )
-                continue
-            
-            # Nested dictionary
-            if isinstance(exp_val, dict):
-                self._compare_dicts(exp_val, act_val, new_path)
-            # List
-            elif isinstance(exp_val, list):
-                self._compare_lists(exp_val, act_val, new_path)
-            # Numeric with tolerance
-            elif isinstance(exp_val, (int, float)) and isinstance(act_val, (int, float)):
-                if abs(exp_val - act_val) > self.tolerance:
-                    self.differences.append(
-                        Difference(
-                            path=new_path,
+                    continue
+
+                # Nested dictionary or list: push a frame instead of recursing.
+                # No == shortcut here: container equality is not type-strict
+                # (a nested 0 == False), so equal-comparing subtrees can
+                # still hide type mismatches and must be walked.
+                if exp_cls is dict or exp_cls is list:
+                    push((exp_val, act_val, parts + (f".{key}",)))
+                # Numeric with tolerance (bool is an int subclass)
+                elif exp_cls is int or exp_cls is float or exp_cls is bool:
+                    # isclose is a single C call; rel_tol=0 keeps the exact
+                    # abs-difference semantics the Python expression had.
+                    if not isclose(exp_val, act_val, rel_tol=0.0, abs_tol=tolerance):
+                        append(
+                            make_diff(
+                                path=f"{join(parts)}.{key}",
+                                expected=exp_val,
+                                actual=act_val,
+                                type="value_mismatch"
+                            )
+                        )
+                # Container subclasses miss the is-checks above but should
+                # still deep-compare rather than fall through to !=
+                elif is_instance(exp_val, (dict, list)):
+                    push((exp_val, act_val, parts + (f".{key}",)))
+                # Direct value comparison
+                elif exp_val != act_val:
+                    append(
+                        make_diff(
+                            path=f"{join(parts)}.{key}",
                             expected=exp_val,
                             actual=act_val,
                             type="value_mismatch"
                         )
                     )
-            # Direct value comparison
-            elif exp_val != act_val:
-                self.differences.append(
-                    Difference(
-                        path=new_path,
-                        expected=exp_val,
-                        actual=act_val,
-                        type="value_mismatch"
-                    )
-                )
-    
-    def _compare_lists(self, expected: list, actual: list, path: str) -> None:
-        """Compare two lists element by element."""
-        if len(expected) != len(actual):
-            self.differences.append(
-                Difference(
-                    path=f"{path}.length",
-                    expected=len(expected),
-                    actual=len(actual),
-                    type="value_mismatch"
-                )
-            )
-            # Continue comparing up to the shorter length
-        
-        for i in range(min(len(expected), len(actual))):
-            exp_item = expected[i]
-            act_item = actual[i]
-            item_path = f"{path}[{i}]"
-            
-            if isinstance(exp_item, dict) and isinstance(act_item, dict):
-                self._compare_dicts(exp_item, act_item, item_path)
-            elif isinstance(exp_item, list) and isinstance(act_item, list):
-                self._compare_lists(exp_item, act_item, item_path)
-            elif exp_item != act_item:
-                self.differences.append(
-                    Difference(
-                        path=item_path,
-                        expected=exp_item,
-                        actual=act_item,
-                        type="value_mismatch"
-                    )
-                )
+
+
+# Per-thread comparator pool: CI suites issue thousands of assertions, and
+# building a fresh instance (plus its list) per call is avoidable churn.
+_TLS = threading.local()
+
+
+def assert_dict_equal(expected: dict, actual: dict, *,
+                      exclude_keys: set[str] | None = None,
+                      tolerance: float = 0.0) -> None:
+    """Stateless assertion entry point backed by a pooled comparator."""
+    comparator = getattr(_TLS, "comparator", None)
+    if comparator is None:
+        comparator = _TLS.comparator = DictComparator()
+    comparator.exclude_keys = set(exclude_keys) if exclude_keys else set()
+    comparator.tolerance = tolerance
+    comparator.assert_equal(expected, actual)
 
 
 # ============================================================================
@@ -446,11 +614,12 @@ def create_workspace():
     if not comparator_file.exists():
         comparator_code = '''"""Deep dictionary comparison utility for production test suites."""
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Difference:
     """Represents a single mismatch between expected and actual values."""
     path: str
@@ -459,6 +628,12 @@ class Difference:
     type: str
 
 
+# Index path fragments like "[3]" recur in every list compared; formatting
+# them once and sharing the references avoids an f-string allocation per
+# element visited. Indices past the cache fall back to formatting.
+_INDEX_STRS = [f"[{i}]" for i in range(256)]
+
+
 class DictMismatchError(AssertionError):
     """Custom exception for dictionary comparison failures."""
     
@@ -482,77 +657,116 @@ class DictMismatchError(AssertionError):
 class DictComparator:
     """Deep recursive dictionary comparator with exclusion rules."""
     
-    def __init__(self, exclude_keys: set[str] | None = None, tolerance: float = 0.0):
+    def __init__(self, exclude_keys: set[str] | None = None, tolerance: float = 0.0,
+                 fail_fast: bool = False):
         self.exclude_keys = exclude_keys or set()
         self.tolerance = tolerance
+        # Specialize the hot loop for the common tolerance=0 case: the
+        # generic != already handles exact numeric equality in C
+        self._use_tolerance = tolerance > 0.0
+        self.fail_fast = fail_fast
         self.differences: list[Difference] = []
+
+    def _record(self, path: str, expected: Any, actual: Any, type_: str) -> None:
+        """Record one difference, raising immediately in fail_fast mode.
+
+        CI gates that only need pass/fail set fail_fast=True: the walk
+        stops at the first mismatch instead of collecting a full report.
+        """
+        diff = Difference(path, expected, actual, type_)
+        self.differences.append(diff)
+        if self.fail_fast:
+            raise DictMismatchError([diff])
     
     def assert_equal(self, expected: dict, actual: dict) -> None:
         """Compare dictionaries and raise DictMismatchError if different."""
         self.differences = []
-        self._compare_dicts(expected, actual, path="root")
+        self._drain(deque([(expected, actual, ("root",))]))
         
         if self.differences:
             raise DictMismatchError(self.differences)
     
-    def _compare_dicts(self, expected: dict, actual: dict, path: str) -> None:
-        """Recursively compare two dictionaries."""
-        for key in expected:
-            if key in self.exclude_keys:
-                continue
-            if key not in actual:
-                self.differences.append(
-                    Difference(f"{path}.{key}", expected[key], "<missing>", "missing_key")
-                )
+    def _compare_dicts(self, expected: dict, actual: dict, parts: tuple) -> None:
+        """Compare two dictionaries (iteratively, via the work stack)."""
+        self._drain(deque([(expected, actual, parts)]))
+    
+    def _compare_lists(self, expected: list, actual: list, parts: tuple) -> None:
+        """Compare two lists element by element."""
+        self._drain(deque([(expected, actual, parts)]))
+    
+    def _drain(self, stack: deque) -> None:
+        """Pop and compare (expected, actual, parts) frames until done.
         
-        for key in actual:
-            if key in self.exclude_keys:
-                continue
-            if key not in expected:
-                self.differences.append(
-                    Difference(f"{path}.{key}", "<missing>", actual[key], "extra_key")
-                )
+        An explicit stack replaces mutual recursion: no call-frame setup
+        per nesting level and no RecursionError on deep payloads. Paths
+        travel as tuples of components; the dotted string is only joined
+        when a Difference is recorded, so equal subtrees allocate no path
+        strings at all.
+        """
+        record = self._record
+        stack_append = stack.append
+        exclude = self.exclude_keys
+        tolerance = self.tolerance
+        use_tolerance = self._use_tolerance
+        _join = "".join
         
-        for key in expected:
-            if key not in actual or key in self.exclude_keys:
+        while stack:
+            expected, actual, parts = stack.pop()
+            
+            if isinstance(expected, list):
+                if len(expected) != len(actual):
+                    record(f"{_join(parts)}.length", len(expected), len(actual), "value_mismatch")
+                for i in range(min(len(expected), len(actual))):
+                    if isinstance(expected[i], dict) and isinstance(actual[i], dict):
+                        idx = _INDEX_STRS[i] if i < 256 else f"[{i}]"
+                        stack_append((expected[i], actual[i], parts + (idx,)))
+                    elif expected[i] != actual[i]:
+                        idx = _INDEX_STRS[i] if i < 256 else f"[{i}]"
+                        record(_join(parts) + idx, expected[i], actual[i], "value_mismatch")
                 continue
             
-            exp_val = expected[key]
-            act_val = actual[key]
-            new_path = f"{path}.{key}"
+            # Dict-view set algebra partitions the keys in C; the exclude check
+            # runs once per dict instead of once per key per loop.
+            ek = expected.keys() - exclude
+            ak = actual.keys() - exclude
             
-            if type(exp_val) != type(act_val):
-                self.differences.append(
-                    Difference(new_path, type(exp_val).__name__, type(act_val).__name__, "type_mismatch")
-                )
-            elif isinstance(exp_val, dict):
-                self._compare_dicts(exp_val, act_val, new_path)
-            elif isinstance(exp_val, list):
-                self._compare_lists(exp_val, act_val, new_path)
-            elif isinstance(exp_val, (int, float)) and abs(exp_val - act_val) > self.tolerance:
-                self.differences.append(
-                    Difference(new_path, exp_val, act_val, "value_mismatch")
-                )
-            elif exp_val != act_val:
-                self.differences.append(
-                    Difference(new_path, exp_val, act_val, "value_mismatch")
-                )
-    
-    def _compare_lists(self, expected: list, actual: list, path: str) -> None:
-        """Compare two lists element by element."""
-        if len(expected) != len(actual):
-            self.differences.append(
-                Difference(f"{path}.length", len(expected), len(actual), "value_mismatch")
-            )
-        
-        for i in range(min(len(expected), len(actual))):
-            item_path = f"{path}[{i}]"
-            if isinstance(expected[i], dict) and isinstance(actual[i], dict):
-                self._compare_dicts(expected[i], actual[i], item_path)
-            elif expected[i] != actual[i]:
-                self.differences.append(
-                    Difference(item_path, expected[i], actual[i], "value_mismatch")
-                )
+            for key in ek - ak:
+                record(f"{_join(parts)}.{key}", expected[key], "<missing>", "missing_key")
+            
+            for key in ak - ek:
+                record(f"{_join(parts)}.{key}", "<missing>", actual[key], "extra_key")
+            
+            for key in ek & ak:
+                exp_val = expected[key]
+                act_val = actual[key]
+                
+                # Same object means the same subtree; == is no substitute
+                # here because it is true across types (True == 1) and
+                # inside equal containers (a nested 0 vs False), which
+                # would swallow the type_mismatch reports below.
+                if exp_val is act_val:
+                    continue
+
+                # type() is computed once and compared by identity; the
+                # branches below reuse it, replacing isinstance MRO walks
+                # with pointer checks for the common built-in types.
+                t = type(exp_val)
+                
+                if t is not type(act_val):
+                    record(f"{_join(parts)}.{key}", t.__name__, type(act_val).__name__, "type_mismatch")
+                elif t is dict or t is list:
+                    stack_append((exp_val, act_val, parts + (f".{key}",)))
+                elif use_tolerance and (t is int or t is float or t is bool):
+                    # Numeric branch only runs when a tolerance is set;
+                    # with tolerance=0 the generic != below is exact anyway
+                    if abs(exp_val - act_val) > tolerance:
+                        record(f"{_join(parts)}.{key}", exp_val, act_val, "value_mismatch")
+                elif isinstance(exp_val, (dict, list)):
+                    # dict/list subclasses miss the identity checks but
+                    # should still deep-compare
+                    stack_append((exp_val, act_val, parts + (f".{key}",)))
+                elif exp_val != act_val:
+                    record(f"{_join(parts)}.{key}", exp_val, act_val, "value_mismatch")
 '''
     (base_dir / "utils" / "comparator.py").write_text(comparator_code)
     (base_dir / "utils" / "__init__.py").write_text("")
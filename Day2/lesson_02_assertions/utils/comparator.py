@@ -1,10 +1,11 @@
 """Deep dictionary comparison utility for production test suites."""
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Difference:
     """Represents a single mismatch between expected and actual values."""
     path: str
@@ -13,6 +14,12 @@ class Difference:
     type: str
 
 
+# Index path fragments like "[3]" recur in every list compared; formatting
+# them once and sharing the references avoids an f-string allocation per
+# element visited. Indices past the cache fall back to formatting.
+_INDEX_STRS = [f"[{i}]" for i in range(256)]
+
+
 class DictMismatchError(AssertionError):
     """Custom exception for dictionary comparison failures."""
     
@@ -36,74 +43,113 @@ class DictMismatchError(AssertionError):
 class DictComparator:
     """Deep recursive dictionary comparator with exclusion rules."""
     
-    def __init__(self, exclude_keys: set[str] | None = None, tolerance: float = 0.0):
+    def __init__(self, exclude_keys: set[str] | None = None, tolerance: float = 0.0,
+                 fail_fast: bool = False):
         self.exclude_keys = exclude_keys or set()
         self.tolerance = tolerance
+        # Specialize the hot loop for the common tolerance=0 case: the
+        # generic != already handles exact numeric equality in C
+        self._use_tolerance = tolerance > 0.0
+        self.fail_fast = fail_fast
         self.differences: list[Difference] = []
+
+    def _record(self, path: str, expected: Any, actual: Any, type_: str) -> None:
+        """Record one difference, raising immediately in fail_fast mode.
+
+        CI gates that only need pass/fail set fail_fast=True: the walk
+        stops at the first mismatch instead of collecting a full report.
+        """
+        diff = Difference(path, expected, actual, type_)
+        self.differences.append(diff)
+        if self.fail_fast:
+            raise DictMismatchError([diff])
     
     def assert_equal(self, expected: dict, actual: dict) -> None:
         """Compare dictionaries and raise DictMismatchError if different."""
         self.differences = []
-        self._compare_dicts(expected, actual, path="root")
+        self._drain(deque([(expected, actual, ("root",))]))
         
         if self.differences:
             raise DictMismatchError(self.differences)
     
-    def _compare_dicts(self, expected: dict, actual: dict, path: str) -> None:
-        """Recursively compare two dictionaries."""
-        for key in expected:
-            if key in self.exclude_keys:
-                continue
-            if key not in actual:
-                self.differences.append(
-                    Difference(f"{path}.{key}", expected[key], "<missing>", "missing_key")
-                )
+    def _compare_dicts(self, expected: dict, actual: dict, parts: tuple) -> None:
+        """Compare two dictionaries (iteratively, via the work stack)."""
+        self._drain(deque([(expected, actual, parts)]))
+    
+    def _compare_lists(self, expected: list, actual: list, parts: tuple) -> None:
+        """Compare two lists element by element."""
+        self._drain(deque([(expected, actual, parts)]))
+    
+    def _drain(self, stack: deque) -> None:
+        """Pop and compare (expected, actual, parts) frames until done.
         
-        for key in actual:
-            if key in self.exclude_keys:
-                continue
-            if key not in expected:
-                self.differences.append(
-                    Difference(f"{path}.{key}", "<missing>", actual[key], "extra_key")
-                )
+        An explicit stack replaces mutual recursion: no call-frame setup
+        per nesting level and no RecursionError on deep payloads. Paths
+        travel as tuples of components; the dotted string is only joined
+        when a Difference is recorded, so equal subtrees allocate no path
+        strings at all.
+        """
+        record = self._record
+        stack_append = stack.append
+        exclude = self.exclude_keys
+        tolerance = self.tolerance
+        use_tolerance = self._use_tolerance
+        _join = "".join
         
-        for key in expected:
-            if key not in actual or key in self.exclude_keys:
+        while stack:
+            expected, actual, parts = stack.pop()
+            
+            if isinstance(expected, list):
+                if len(expected) != len(actual):
+                    record(f"{_join(parts)}.length", len(expected), len(actual), "value_mismatch")
+                for i in range(min(len(expected), len(actual))):
+                    if isinstance(expected[i], dict) and isinstance(actual[i], dict):
+                        idx = _INDEX_STRS[i] if i < 256 else f"[{i}]"
+                        stack_append((expected[i], actual[i], parts + (idx,)))
+                    elif expected[i] != actual[i]:
+                        idx = _INDEX_STRS[i] if i < 256 else f"[{i}]"
+                        record(_join(parts) + idx, expected[i], actual[i], "value_mismatch")
                 continue
             
-            exp_val = expected[key]
-            act_val = actual[key]
-            new_path = f"{path}.{key}"
+            # Dict-view set algebra partitions the keys in C; the exclude check
+            # runs once per dict instead of once per key per loop.
+            ek = expected.keys() - exclude
+            ak = actual.keys() - exclude
             
-            if type(exp_val) != type(act_val):
-                self.differences.append(
-                    Difference(new_path, type(exp_val).__name__, type(act_val).__name__, "type_mismatch")
-                )
-            elif isinstance(exp_val, dict):
-                self._compare_dicts(exp_val, act_val, new_path)
-            elif isinstance(exp_val, list):
-                self._compare_lists(exp_val, act_val, new_path)
-            elif isinstance(exp_val, (int, float)) and abs(exp_val - act_val) > self.tolerance:
-                self.differences.append(
-                    Difference(new_path, exp_val, act_val, "value_mismatch")
-                )
-            elif exp_val != act_val:
-                self.differences.append(
-                    Difference(new_path, exp_val, act_val, "value_mismatch")
-                )
-    
-    def _compare_lists(self, expected: list, actual: list, path: str) -> None:
-        """Compare two lists element by element."""
-        if len(expected) != len(actual):
-            self.differences.append(
-                Difference(f"{path}.length", len(expected), len(actual), "value_mismatch")
-            )
-        
-        for i in range(min(len(expected), len(actual))):
-            item_path = f"{path}[{i}]"
-            if isinstance(expected[i], dict) and isinstance(actual[i], dict):
-                self._compare_dicts(expected[i], actual[i], item_path)
-            elif expected[i] != actual[i]:
-                self.differences.append(
-                    Difference(item_path, expected[i], actual[i], "value_mismatch")
-                )
+            for key in ek - ak:
+                record(f"{_join(parts)}.{key}", expected[key], "<missing>", "missing_key")
+            
+            for key in ak - ek:
+                record(f"{_join(parts)}.{key}", "<missing>", actual[key], "extra_key")
+            
+            for key in ek & ak:
+                exp_val = expected[key]
+                act_val = actual[key]
+                
+                # Same object means the same subtree; == is no substitute
+                # here because it is true across types (True == 1) and
+                # inside equal containers (a nested 0 vs False), which
+                # would swallow the type_mismatch reports below.
+                if exp_val is act_val:
+                    continue
+
+                # type() is computed once and compared by identity; the
+                # branches below reuse it, replacing isinstance MRO walks
+                # with pointer checks for the common built-in types.
+                t = type(exp_val)
+                
+                if t is not type(act_val):
+                    record(f"{_join(parts)}.{key}", t.__name__, type(act_val).__name__, "type_mismatch")
+                elif t is dict or t is list:
+                    stack_append((exp_val, act_val, parts + (f".{key}",)))
+                elif use_tolerance and (t is int or t is float or t is bool):
+                    # Numeric branch only runs when a tolerance is set;
+                    # with tolerance=0 the generic != below is exact anyway
+                    if abs(exp_val - act_val) > tolerance:
+                        record(f"{_join(parts)}.{key}", exp_val, act_val, "value_mismatch")
+                elif isinstance(exp_val, (dict, list)):
+                    # dict/list subclasses miss the identity checks but
+                    # should still deep-compare
+                    stack_append((exp_val, act_val, parts + (f".{key}",)))
+                elif exp_val != act_val:
+                    record(f"{_join(parts)}.{key}", exp_val, act_val, "value_mismatch")
@@ -4,6 +4,7 @@ Demo Runner for Lesson 3
 Continuously runs tests and updates metrics to demonstrate the system
 """
 import json
+import os
 import time
 import sys
 from pathlib import Path
@@ -12,53 +13,104 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.parser import parse_users_from_file, filter_adults, filter_active_adults
+from utils.parser import parse_users_from_file, count_age_groups
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Last parse result keyed on the data file's mtime: the demo re-runs every
+# few seconds against a file that rarely changes, so steady-state ticks skip
+# the open/read/json-parse entirely.
+_parse_cache = {"mtime": None, "users": None}
+
+# Run counter and last written counts live in memory: the old code read
+# metrics.json back just to increment test_runs, and rewrote the file even
+# when nothing had changed.
+_metrics_state = {"test_runs": None, "last_counts": None}
+
+# Timestamp strings only carry second precision, so formatting more than
+# once per second is wasted work; cache the pair for 1s of wall time.
+_ts_cache = [0.0, "", ""]
+
+def _now_strings():
+    """Return (isoformat, 'YYYY-MM-DD HH:MM:SS') strings, cached for 1s."""
+    t = time.time()
+    if t - _ts_cache[0] < 1.0:
+        return _ts_cache[1], _ts_cache[2]
+    now = datetime.now()
+    iso = now.isoformat()
+    short = now.strftime('%Y-%m-%d %H:%M:%S')
+    _ts_cache[:] = [t, iso, short]
+    return iso, short
 
 def update_metrics():
     """Run tests and update metrics file."""
     data_file = Path(__file__).parent / "data" / "users.json"
     output_file = Path(__file__).parent / "output" / "metrics.json"
-    
+
     try:
-        # Parse users
-        users = parse_users_from_file(data_file)
-        adults = filter_adults(users)
-        active_adults = filter_active_adults(users)
-        minors = [u for u in users if u.age is not None and u.age <= 18]
-        
+        # Parse users, reusing the cached parse while the file is unchanged
+        try:
+            mtime = data_file.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == _parse_cache["mtime"]:
+            users = _parse_cache["users"]
+        else:
+            users = parse_users_from_file(data_file)
+            _parse_cache["mtime"] = mtime
+            _parse_cache["users"] = users
+
+        # Count age groups in a single pass
+        adults, active_adults, minors = count_age_groups(users)
+
         # Calculate metrics
         total_records = 12  # Original data has 12 records
         success_rate = (len(users) / total_records * 100) if total_records > 0 else 0
-        
-        # Read existing metrics or create new
-        if output_file.exists():
-            try:
-                with output_file.open('r') as f:
-                    metrics = json.load(f)
-            except:
-                metrics = {"test_runs": 0}
-        else:
-            metrics = {"test_runs": 0}
-        
-        # Update metrics
-        metrics.update({
-            "timestamp": datetime.now().isoformat(),
+        counts = (len(users), adults, active_adults, minors, round(success_rate, 2))
+
+        # Seed the run counter from a previous session once, then increment
+        # in memory instead of reading the file back every tick
+        if _metrics_state["test_runs"] is None:
+            runs = 0
+            if output_file.exists():
+                try:
+                    with output_file.open('r') as f:
+                        runs = json.load(f).get("test_runs", 0)
+                except:
+                    runs = 0
+            _metrics_state["test_runs"] = runs
+        _metrics_state["test_runs"] += 1
+
+        iso_now, short_now = _now_strings()
+        metrics = {
+            "timestamp": iso_now,
             "total_users": len(users),
-            "adults": len(adults),
-            "active_adults": len(active_adults),
-            "minors": len(minors),
+            "adults": adults,
+            "active_adults": active_adults,
+            "minors": minors,
             "parse_success_rate": round(success_rate, 2),
-            "test_runs": metrics.get("test_runs", 0) + 1,
-            "last_update": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-        
-        # Write metrics
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open('w') as f:
-            json.dump(metrics, f, indent=2)
-        
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Metrics updated: "
-              f"Users={len(users)}, Adults={len(adults)}, Active Adults={len(active_adults)}, "
+            "test_runs": _metrics_state["test_runs"],
+            "last_update": short_now
+        }
+
+        # Rewrite only when the data-derived values moved, and write via a
+        # temp file + os.replace so the dashboard never reads a torn file
+        if counts != _metrics_state["last_counts"]:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = output_file.with_suffix('.json.tmp')
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
+            else:
+                with tmp_file.open('w') as f:
+                    json.dump(metrics, f, indent=2)
+            os.replace(tmp_file, output_file)
+            _metrics_state["last_counts"] = counts
+
+        print(f"[{short_now[-8:]}] Metrics updated: "
+              f"Users={len(users)}, Adults={adults}, Active Adults={active_adults}, "
               f"Test Runs={metrics['test_runs']}")
         
         return True
@@ -8,7 +8,12 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.parser import parse_users_from_file, filter_adults, filter_active_adults
+from utils.parser import (
+    parse_users_from_file,
+    filter_adults,
+    filter_active_adults,
+    partition_users,
+)
 from utils.user_model import User
 import logging
 from datetime import datetime
@@ -16,6 +21,18 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared row template: rows are rendered individually and joined once,
+# instead of growing an immutable string quadratically with +=
+_USER_ROW = """                        <tr>
+                            <td>{id}</td>
+                            <td>{name}</td>
+                            <td>{age_display}</td>
+                            <td>{email}</td>
+                            <td><span class="badge {status_badge}">{status_upper}</span></td>
+                            <td><span class="badge {age_badge}">{age_upper}</span></td>
+                        </tr>
+        """
+
 
 def test_parse_users():
     """Test user parsing with realistic data and edge cases."""
@@ -191,22 +208,24 @@ def generate_html_report(users, adults, active_adults, output_path):
         </body>
         </html>"""
     
-    # Build user rows
-    user_rows = ""
+    # Build user rows: collect per-row strings and join once (O(N))
+    rows = []
     for user in users:
         age_display = str(user.age) if user.age else "Unknown"
         age_badge = "adult" if user.is_adult() else ("minor" if user.age else "unknown")
         status_badge = "active" if user.is_active else "inactive"
-        
-        user_rows += f"""                        <tr>
-                            <td>{user.id}</td>
-                            <td>{user.name}</td>
-                            <td>{age_display}</td>
-                            <td>{user.email or 'N/A'}</td>
-                            <td><span class="badge {status_badge}">{status_badge.upper()}</span></td>
-                            <td><span class="badge {age_badge}">{age_badge.upper()}</span></td>
-                        </tr>
-        """
+
+        rows.append(_USER_ROW.format(
+            id=user.id,
+            name=user.name,
+            age_display=age_display,
+            email=user.email or 'N/A',
+            status_badge=status_badge,
+            status_upper=status_badge.upper(),
+            age_badge=age_badge,
+            age_upper=age_badge.upper(),
+        ))
+    user_rows = "".join(rows)
     
     # Format the template with actual values
     html = html_template.format(
@@ -233,10 +252,15 @@ def run_all_tests():
         users = test_parse_users()
         adults = test_filter_adults(users)
         active_adults = test_filter_active_adults(users)
-        
-        # Generate report
+
+        # The fused single-pass partition must agree with the two filters
+        adults_fused, active_fused = partition_users(users)
+        assert adults_fused == adults, "partition_users adults mismatch"
+        assert active_fused == active_adults, "partition_users active adults mismatch"
+
+        # Generate report from the fused results
         output_path = Path(__file__).parent.parent / "output"
-        generate_html_report(users, adults, active_adults, output_path)
+        generate_html_report(users, adults_fused, active_fused, output_path)
         
         # Final summary
         print("\n" + "=" * 60)
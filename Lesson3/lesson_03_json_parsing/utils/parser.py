@@ -2,14 +2,40 @@
 Production-grade JSON parsing utilities with error boundaries.
 """
 import json
+import operator
+from collections import Counter
 from pathlib import Path
 from typing import List
 import logging
 
 from utils.user_model import User
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 logger = logging.getLogger(__name__)
 
+# simdjson parses lazily: records come back as views into the document and
+# keys User.from_dict never touches are never converted to Python objects.
+# The parser is reused across calls; its document is consumed before return.
+_simd_parser = simdjson.Parser() if simdjson is not None else None
+
+# Parsed records are dicts from json/orjson but Object/Array views from
+# simdjson; the structure checks below accept either.
+_MAPPING_TYPES = (dict,) if simdjson is None else (dict, simdjson.Object)
+_ARRAY_TYPES = (list,) if simdjson is None else (list, simdjson.Array)
+
+# Hoisted attribute getter for the counting loop: one C-level call fetches
+# both fields per user instead of two Python attribute lookups.
+_get_age_active = operator.attrgetter("age", "is_active")
+
 
 def parse_users_from_file(filepath: Path) -> List[User]:
     """
@@ -32,37 +58,68 @@ def parse_users_from_file(filepath: Path) -> List[User]:
         logger.error(f"File not found: {filepath}")
         return []
     
-    # Read and parse JSON with error boundary
+    # Read and parse JSON with error boundary; simdjson scans the bytes with
+    # SIMD and defers per-key conversion, orjson is the next-fastest full
+    # parse, stdlib json is the fallback
+    # One read_bytes() slurps the file in a single syscall and every parser
+    # scans the contiguous buffer; feeding a text-mode file object to
+    # json.load costs chunked reads plus a separate UTF-8 decode pass.
     try:
-        with filepath.open('r', encoding='utf-8') as f:
-            raw_data = json.load(f)
-    except json.JSONDecodeError as e:
+        raw = filepath.read_bytes()
+        if _simd_parser is not None:
+            raw_data = _simd_parser.parse(raw)
+        elif orjson is not None:
+            raw_data = orjson.loads(raw)
+        else:
+            raw_data = json.loads(raw)
+    except ValueError as e:
+        # json.JSONDecodeError, orjson.JSONDecodeError, and simdjson parse
+        # errors are all ValueError subclasses
         logger.error(f"Invalid JSON in {filepath}: {e}")
         return []
     except Exception as e:
         logger.error(f"Failed to read {filepath}: {e}")
         return []
-    
+
     # Validate data structure
-    if not isinstance(raw_data, list):
+    if not isinstance(raw_data, _ARRAY_TYPES):
         logger.error(f"Expected JSON array, got {type(raw_data)}")
         return []
     
-    # Parse each record with individual error boundaries
-    users: List[User] = []
+    # Parse each record with individual error boundaries. The result list
+    # is pre-sized to the record count and trimmed afterwards: writing by
+    # index avoids the repeated grow-reallocations append would trigger.
+    users: List[User] = [None] * len(raw_data)
+    written = 0
     failed_count = 0
-    
+    non_dict_count = 0
+
+    # Per-record warnings accumulate in counters; one summary line after
+    # the loop replaces a LogRecord allocation per dirty row
+    age_stats: Counter = Counter()
+
     for idx, record in enumerate(raw_data):
-        if not isinstance(record, dict):
-            logger.warning(f"Record {idx} is not a dict: {type(record)}")
+        if not isinstance(record, _MAPPING_TYPES):
+            non_dict_count += 1
             failed_count += 1
             continue
-        
-        user = User.from_dict(record)
+
+        user = User.from_dict(record, stats=age_stats)
         if user is not None:
-            users.append(user)
+            users[written] = user
+            written += 1
         else:
             failed_count += 1
+
+    del users[written:]
+
+    if non_dict_count > 0:
+        logger.warning(f"{non_dict_count} records were not dicts")
+    if age_stats:
+        logger.warning(
+            f"Age issues: {age_stats['invalid_age']} invalid formats, "
+            f"{age_stats['suspicious_age']} suspicious values"
+        )
     
     # Log parsing statistics
     total = len(raw_data)
@@ -87,12 +144,14 @@ def filter_adults(users: List[User]) -> List[User]:
     Returns:
         List containing only users with age > 18
     """
-    adults = [u for u in users if u.is_adult()]
-    
+    # filter + attrgetter over the precomputed flag dispatches at C speed,
+    # with no method call per user
+    adults = list(filter(operator.attrgetter('is_adult_cached'), users))
+
     logger.info(
         f"Filtered {len(adults)} adults from {len(users)} total users"
     )
-    
+
     return adults
 
 
@@ -103,12 +162,79 @@ def filter_active_adults(users: List[User]) -> List[User]:
     Demonstrates chaining filters for complex business logic.
     """
     active_adults = [
-        u for u in users 
-        if u.is_adult() and u.is_active
+        u for u in users
+        if u.is_adult_cached and u.is_active
     ]
-    
+
     logger.info(
         f"Filtered {len(active_adults)} active adults from {len(users)} users"
     )
-    
+
     return active_adults
+
+
+def partition_users(users: List[User]) -> tuple:
+    """
+    Split users into (adults, active_adults) lists in a single pass.
+
+    Callers that need both lists previously ran filter_adults and
+    filter_active_adults back to back — two traversals evaluating
+    is_adult() twice per user. One fused loop halves the work.
+
+    Args:
+        users: List of User objects
+
+    Returns:
+        Tuple of (adults, active_adults) lists
+    """
+    adults: List[User] = []
+    active_adults: List[User] = []
+    adults_append = adults.append
+    active_append = active_adults.append
+
+    for user in users:
+        if user.is_adult_cached:
+            adults_append(user)
+            if user.is_active:
+                active_append(user)
+
+    logger.info(
+        f"Partitioned {len(users)} users into {len(adults)} adults "
+        f"({len(active_adults)} active)"
+    )
+
+    return adults, active_adults
+
+
+def count_age_groups(users: List[User]) -> tuple:
+    """
+    Count adults, active adults, and minors in a single pass.
+
+    The metrics pipeline only needs the counts, so one fused loop replaces
+    three separate traversals (filter_adults, filter_active_adults, and a
+    minors comprehension) and skips the intermediate list allocations.
+
+    Args:
+        users: List of User objects
+
+    Returns:
+        Tuple of (adults, active_adults, minors) counts
+    """
+    adults = active_adults = minors = 0
+    for user in users:
+        age, is_active = _get_age_active(user)
+        if age is None:
+            continue
+        if age > 18:
+            adults += 1
+            if is_active:
+                active_adults += 1
+        else:
+            minors += 1
+
+    logger.info(
+        f"Counted {adults} adults, {active_adults} active adults, "
+        f"{minors} minors from {len(users)} users"
+    )
+
+    return adults, active_adults, minors
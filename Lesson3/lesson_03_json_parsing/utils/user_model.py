@@ -1,14 +1,19 @@
 """
 User data model with defensive parsing capabilities.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Represents a user with validated fields and safe defaults.
@@ -23,72 +28,169 @@ class User:
     age: Optional[int] = None
     email: str = ""
     is_active: bool = True
-    
+    # Computed once at construction so hot filter loops read a plain
+    # attribute instead of paying a method call per user
+    is_adult_cached: bool = field(init=False, default=False)
+
+    def __post_init__(self):
+        """Precompute derived flags used by the filter helpers"""
+        self.is_adult_cached = self.age is not None and self.age > 18
+
     @classmethod
-    def from_dict(cls, data: dict) -> Optional['User']:
+    def from_dict(cls, data: dict, stats=None) -> Optional['User']:
         """
         Safely construct a User from a dictionary.
-        
+
         This factory method is the core of defensive parsing:
         1. Uses .get() with fallbacks instead of direct key access
         2. Handles type coercion explicitly (string to int)
         3. Returns None on failure instead of crashing
         4. Logs parsing errors for production debugging
-        
+
         Args:
             data: Raw dictionary from JSON parsing
-            
+            stats: Optional Counter; when given, age warnings increment
+                counters here instead of logging per record, so bulk
+                callers can emit one summary line
+
         Returns:
             User instance if valid, None if parsing fails
         """
         try:
+            # One bound-method local serves all five field reads
+            get = data.get
+
             # Extract ID with validation
-            user_id = data.get('id')
+            user_id = get('id')
             if user_id is None:
                 raise ValueError("Missing required field: id")
-            
-            # Coerce to int, handling string IDs
-            user_id = int(user_id)
-            
-            # Extract name with default
-            name = str(data.get('name', 'Unknown User')).strip()
+
+            # Coerce to int, handling string IDs. JSON parsers hand back
+            # native ints for numeric fields, so the exact-type check skips
+            # a no-op int() call on the overwhelming majority of records.
+            if type(user_id) is not int:
+                user_id = int(user_id)
+
+            # Extract name with default (same fast path: usually already str)
+            raw_name = get('name', 'Unknown User')
+            name = (raw_name if type(raw_name) is str else str(raw_name)).strip()
             if not name:
                 name = 'Unknown User'
-            
+
             # Handle age with multiple edge cases
-            raw_age = data.get('age')
+            raw_age = get('age')
             age = None
             if raw_age is not None:
-                try:
-                    age = int(raw_age)
-                    if age < 0 or age > 150:  # Sanity check
+                if type(raw_age) is int:
+                    age = raw_age
+                else:
+                    try:
+                        age = int(raw_age)
+                    except (ValueError, TypeError):
+                        if stats is not None:
+                            stats['invalid_age'] += 1
+                        else:
+                            logger.warning(f"Invalid age format for user {user_id}: {raw_age}")
+                if age is not None and (age < 0 or age > 150):  # Sanity check
+                    if stats is not None:
+                        stats['suspicious_age'] += 1
+                    else:
                         logger.warning(f"Suspicious age value: {age} for user {user_id}")
-                        age = None
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid age format for user {user_id}: {raw_age}")
                     age = None
-            
+
             # Extract email with validation
-            email = str(data.get('email', '')).strip()
-            
+            raw_email = get('email', '')
+            email = (raw_email if type(raw_email) is str else str(raw_email)).strip()
+
             # Extract active status
-            is_active = bool(data.get('is_active', True))
+            raw_active = get('is_active', True)
+            is_active = raw_active if type(raw_active) is bool else bool(raw_active)
             
-            return cls(
-                id=user_id,
-                name=name,
-                age=age,
-                email=email,
-                is_active=is_active
-            )
+            # Positional construction skips keyword-argument matching in the
+            # generated dataclass __init__
+            return cls(user_id, name, age, email, is_active)
             
         except (ValueError, TypeError, KeyError) as e:
             logger.error(f"Failed to parse user record: {e}, data: {data}")
             return None
     
+    @classmethod
+    def bulk_from_list(cls, records: list) -> list:
+        """
+        Construct Users from a whole batch of records at once.
+
+        When numpy is available and every record carries an integer age,
+        the 0-150 sanity check runs as a single vectorized compare over
+        the batch instead of two Python branches per record; out-of-range
+        ages are nulled exactly as from_dict would null them. Batches
+        with missing, None, or string ages fall back to per-record
+        from_dict, so the semantics always match calling from_dict on
+        each record (failed records are dropped, not None-padded).
+
+        Args:
+            records: List of raw dictionaries from JSON parsing
+
+        Returns:
+            List of successfully parsed User objects
+        """
+        ages = None
+        if np is not None and records:
+            try:
+                ages = np.fromiter(
+                    (r['age'] for r in records),
+                    dtype=np.int64,
+                    count=len(records),
+                )
+            except (KeyError, TypeError, ValueError):
+                # Heterogeneous batch: no single dtype to vectorize over
+                ages = None
+
+        users: list = []
+        append = users.append
+
+        if ages is None:
+            for record in records:
+                if not isinstance(record, dict):
+                    continue
+                user = cls.from_dict(record)
+                if user is not None:
+                    append(user)
+            return users
+
+        age_ok = ((ages >= 0) & (ages <= 150)).tolist()
+        suspicious = len(records) - sum(age_ok)
+        if suspicious:
+            logger.warning(f"{suspicious} suspicious age values in batch of {len(records)}")
+
+        for record, age, ok in zip(records, ages.tolist(), age_ok):
+            try:
+                get = record.get
+                user_id = get('id')
+                if user_id is None:
+                    raise ValueError("Missing required field: id")
+                if type(user_id) is not int:
+                    user_id = int(user_id)
+
+                raw_name = get('name', 'Unknown User')
+                name = (raw_name if type(raw_name) is str else str(raw_name)).strip()
+                if not name:
+                    name = 'Unknown User'
+
+                raw_email = get('email', '')
+                email = (raw_email if type(raw_email) is str else str(raw_email)).strip()
+
+                raw_active = get('is_active', True)
+                is_active = raw_active if type(raw_active) is bool else bool(raw_active)
+
+                append(cls(user_id, name, age if ok else None, email, is_active))
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                logger.error(f"Failed to parse user record: {e}, data: {record}")
+
+        return users
+
     def is_adult(self) -> bool:
         """Check if user is an adult (age > 18)."""
-        return self.age is not None and self.age > 18
+        return self.is_adult_cached
     
     def __repr__(self) -> str:
         """Human-readable representation."""
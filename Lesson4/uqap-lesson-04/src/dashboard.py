@@ -1,16 +1,21 @@
 """
 Web dashboard for visualizing parsed user data
 """
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, jsonify, Response
 from pathlib import Path
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data_parser import load_users, benchmark_parsing
-from src.models import UserModel
+from src.models import UserModel, UserTable
 
 # Set template folder to parent directory's templates folder
 template_dir = Path(__file__).parent.parent / "templates"
@@ -35,11 +40,16 @@ def get_users():
         
         users = load_users(csv_file)
         users_data = [user.to_dict() for user in users]
-        
-        return jsonify({
+        payload = {
             "users": users_data,
             "count": len(users_data)
-        })
+        }
+
+        # orjson serializes straight to bytes in one pass, several times
+        # faster than the stdlib serializer jsonify goes through
+        if orjson is not None:
+            return Response(orjson.dumps(payload), mimetype='application/json')
+        return jsonify(payload)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -57,19 +67,12 @@ def get_stats():
         users = load_users(csv_file)
         metrics = benchmark_parsing(csv_file)
         
-        # Calculate statistics
-        role_counts = {}
-        active_count = 0
-        privileged_count = 0
-        
-        for user in users:
-            role = user.role
-            role_counts[role] = role_counts.get(role, 0) + 1
-            if user.active:
-                active_count += 1
-            if user.is_privileged():
-                privileged_count += 1
-        
+        # Calculate statistics column-by-column instead of object-by-object
+        table = UserTable.from_users(users)
+        role_counts = table.role_counts()
+        active_count = table.active_count()
+        privileged_count = table.privileged_count()
+
         return jsonify({
             "total_users": len(users),
             "active_users": active_count,
@@ -2,6 +2,7 @@
 CSV/Excel data parser with type safety
 """
 import csv
+import functools
 from pathlib import Path
 from typing import Iterator
 import time
@@ -15,47 +16,113 @@ except ImportError:
 
 from src.models import UserModel
 
+# Shared truthy vocabulary for the 'active' column; a module-level
+# frozenset means no per-call set construction and every loader agrees on
+# what counts as true.
+_TRUTHY = frozenset({'TRUE', '1', 'YES', 'Y'})
+
+
+def _load_users_csv_pandas(file_path: Path) -> list[UserModel]:
+    """
+    Vectorized CSV load: pandas parses in C and the strip/lower/boolean
+    normalization runs once per column instead of once per row. Only the
+    final UserModel construction (and its validation) stays per-row.
+    """
+    df = pd.read_csv(
+        file_path,
+        dtype={'email': str, 'password': str, 'role': str, 'active': str},
+        keep_default_na=False,
+    )
+
+    required = {'email', 'password', 'role', 'active'}
+    missing = required - set(df.columns)
+    if missing:
+        raise ValueError(f"CSV missing required columns: {sorted(missing)}")
+
+    emails = df['email'].str.strip().tolist()
+    passwords = df['password'].str.strip().tolist()
+    roles = df['role'].str.strip().str.lower().tolist()
+    actives = df['active'].str.strip().str.upper().isin(_TRUTHY).tolist()
+    created = df['created_at'].tolist() if 'created_at' in df.columns else [None] * len(df)
+
+    users = []
+    for row_num, (email, password, role, active, created_at) in enumerate(
+            zip(emails, passwords, roles, actives, created), start=2):
+        try:
+            users.append(UserModel(
+                email=email,
+                password=password,
+                role=role,
+                active=active,
+                created_at=created_at
+            ))
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Error parsing row {row_num}: {e}") from e
+
+    return users
+
 
 def load_users_csv(file_path: Path) -> list[UserModel]:
     """
-    Load users from CSV using standard library (no dependencies)
-    
+    Load users from CSV, vectorized via pandas when available
+
     Args:
         file_path: Path to CSV file
-        
+
     Returns:
         List of validated UserModel objects
-        
+
     Raises:
         FileNotFoundError: If CSV doesn't exist
         ValueError: If data validation fails
     """
     if not file_path.exists():
         raise FileNotFoundError(f"CSV not found: {file_path}")
-    
+
+    if PANDAS_AVAILABLE:
+        return _load_users_csv_pandas(file_path)
+
     users = []
-    
+
     with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return users
+
+        # Resolve column positions once from the header; csv.reader then
+        # hands back plain lists indexed directly, instead of DictReader
+        # building and hashing a fresh dict per row
+        try:
+            ei = header.index('email')
+            pi = header.index('password')
+            ri = header.index('role')
+            ai = header.index('active')
+        except ValueError as e:
+            raise ValueError(f"CSV missing required column: {e}") from e
+        ci = header.index('created_at') if 'created_at' in header else -1
+
+        # Loop invariants live in locals: LOAD_FAST beats a global lookup
+        # and a set literal allocation on every row
+        append = users.append
+        truthy = _TRUTHY
+
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
             try:
                 # Normalize boolean values
-                active_val = row['active'].strip().upper()
-                active = active_val in {'TRUE', '1', 'YES', 'Y'}
-                
-                user = UserModel(
-                    email=row['email'].strip(),
-                    password=row['password'].strip(),
-                    role=row['role'].strip().lower(),
+                active = row[ai].strip().upper() in truthy
+
+                append(UserModel(
+                    email=row[ei].strip(),
+                    password=row[pi].strip(),
+                    role=row[ri].strip().lower(),
                     active=active,
-                    created_at=row.get('created_at', None)
-                )
-                users.append(user)
-                
-            except (KeyError, ValueError) as e:
+                    created_at=row[ci] if ci >= 0 else None
+                ))
+
+            except (KeyError, ValueError, IndexError) as e:
                 raise ValueError(f"Error parsing row {row_num}: {e}") from e
-    
+
     return users
 
 
@@ -104,20 +171,28 @@ def load_users_excel(file_path: Path, sheet_name: str = 'TestUsers') -> list[Use
     # Handle missing values
     df = df.fillna({'created_at': None})
     
+    # Pull each column out as a numpy array once and zip them: iterrows
+    # allocates a Series per row and is the slowest pandas iteration path
+    emails = df['email'].to_numpy()
+    passwords = df['password'].to_numpy()
+    roles = df['role'].to_numpy()
+    actives = df['active'].to_numpy()
+    createds = df['created_at'].to_numpy() if 'created_at' in df.columns else [None] * len(df)
+
     users = []
-    for idx, row in df.iterrows():
+    for row_num, (email, password, role, active, created_at) in enumerate(
+            zip(emails, passwords, roles, actives, createds), start=2):
         try:
-            user = UserModel(
-                email=row['email'].strip(),
-                password=row['password'].strip(),
-                role=row['role'].strip().lower(),
-                active=row['active'],
-                created_at=row.get('created_at', None)
-            )
-            users.append(user)
+            users.append(UserModel(
+                email=email.strip(),
+                password=password.strip(),
+                role=role.strip().lower(),
+                active=active,
+                created_at=created_at
+            ))
         except (KeyError, ValueError) as e:
-            raise ValueError(f"Error parsing Excel row {idx + 2}: {e}") from e
-    
+            raise ValueError(f"Error parsing Excel row {row_num}: {e}") from e
+
     return users
 
 
@@ -137,7 +212,7 @@ def load_users_lazy(file_path: Path) -> Iterator[UserModel]:
         reader = csv.DictReader(f)
         
         for row in reader:
-            active = row['active'].strip().upper() in {'TRUE', '1', 'YES'}
+            active = row['active'].strip().upper() in _TRUTHY
             
             yield UserModel(
                 email=row['email'].strip(),
@@ -148,52 +223,86 @@ def load_users_lazy(file_path: Path) -> Iterator[UserModel]:
             )
 
 
+def _load_users_uncached(path: Path, **kwargs) -> list[UserModel]:
+    """Dispatch to the format-specific loader without caching"""
+    if path.suffix == '.csv':
+        return load_users_csv(path)
+    elif path.suffix in {'.xlsx', '.xls'}:
+        return load_users_excel(path, **kwargs)
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}. Use .csv, .xlsx, or .xls")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_users_cached(path_str: str, mtime_ns: int, size: int) -> list[UserModel]:
+    """Parse keyed on the file's stat signature; unchanged files hit the cache"""
+    return _load_users_uncached(Path(path_str))
+
+
 def load_users(file_path: Path | str, **kwargs) -> list[UserModel]:
     """
     Universal loader - auto-detects format and loads accordingly
-    
+
+    Repeated loads of an unchanged file (the dashboard hits this on every
+    request) return a cached parse keyed on (path, mtime, size).
+
     Args:
         file_path: Path to data file (CSV or Excel)
         **kwargs: Additional arguments passed to specific loader
-        
+
     Returns:
         List of validated UserModel objects
     """
     path = Path(file_path)
-    
-    if path.suffix == '.csv':
-        return load_users_csv(path)
-    elif path.suffix in {'.xlsx', '.xls'}:
-        return load_users_excel(path, **kwargs)
-    else:
-        raise ValueError(f"Unsupported file format: {path.suffix}. Use .csv, .xlsx, or .xls")
 
+    # Loader kwargs (e.g. sheet_name) change the result, so only the plain
+    # call goes through the cache
+    if kwargs:
+        return _load_users_uncached(path, **kwargs)
 
-def benchmark_parsing(file_path: Path, runs: int = 5) -> dict:
-    """
-    Measure parsing performance
-    
-    Returns:
-        Dictionary with performance metrics
-    """
+    try:
+        st = path.stat()
+    except OSError:
+        return _load_users_uncached(path)
+    return _load_users_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _benchmark_cached(path_str: str, mtime_ns: int, size: int, runs: int) -> dict:
+    """Time the uncached loader so cache hits don't skew the numbers"""
+    path = Path(path_str)
     times = []
-    
+
     for _ in range(runs):
         start = time.perf_counter()
-        users = load_users(file_path)
+        users = _load_users_uncached(path)
         end = time.perf_counter()
         times.append(end - start)
-    
+
     avg_time = sum(times) / len(times)
-    
+
     return {
-        "file": file_path.name,
+        "file": path.name,
         "records": len(users),
         "avg_time_ms": avg_time * 1000,
         "time_per_record_ms": (avg_time * 1000) / len(users) if users else 0
     }
 
 
+def benchmark_parsing(file_path: Path, runs: int = 5) -> dict:
+    """
+    Measure parsing performance
+
+    Results are cached on the file's stat signature, so repeated dashboard
+    requests reuse the measurement until the file changes.
+
+    Returns:
+        Dictionary with performance metrics
+    """
+    st = file_path.stat()
+    return _benchmark_cached(str(file_path), st.st_mtime_ns, st.st_size, runs).copy()
+
+
 if __name__ == "__main__":
     # Demo usage
     print("\n[UQAP] Data Parser Demo\n")
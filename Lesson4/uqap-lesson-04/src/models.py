@@ -1,12 +1,23 @@
 """
 Data models for test users
 """
-from dataclasses import dataclass
+import re
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 
+# One compiled C-level scan replaces the old two-pass "@" / "." checks and
+# the list allocated by split("@")
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
 
-@dataclass
+# Role sets are shared by every instance; building them once avoids a set
+# allocation per row when loading large files
+_VALID_ROLES = frozenset({"user", "admin", "viewer", "editor"})
+_PRIVILEGED = frozenset({"admin", "editor"})
+
+
+@dataclass(slots=True)
 class UserModel:
     """Represents a test user account with validation"""
     
@@ -15,11 +26,14 @@ class UserModel:
     role: str
     active: bool
     created_at: Optional[str] = None
-    
+    # Precomputed at construction so scans read an attribute instead of
+    # paying a method call and set lookup per user
+    is_privileged_cached: bool = field(init=False, default=False)
+
     def __post_init__(self):
         """Validate data immediately after initialization"""
         # Email validation
-        if "@" not in self.email or "." not in self.email.split("@")[1]:
+        if not _EMAIL_RE.match(self.email):
             raise ValueError(f"Invalid email format: {self.email}")
         
         # Password strength
@@ -27,9 +41,10 @@ class UserModel:
             raise ValueError(f"Password too short (min 8 chars): {len(self.password)} chars")
         
         # Role whitelist
-        valid_roles = {"user", "admin", "viewer", "editor"}
-        if self.role not in valid_roles:
-            raise ValueError(f"Invalid role '{self.role}'. Must be one of {valid_roles}")
+        if self.role not in _VALID_ROLES:
+            raise ValueError(f"Invalid role '{self.role}'. Must be one of {set(_VALID_ROLES)}")
+
+        self.is_privileged_cached = self.role in _PRIVILEGED
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
@@ -43,9 +58,48 @@ class UserModel:
     
     def is_privileged(self) -> bool:
         """Check if user has elevated permissions"""
-        return self.role in {"admin", "editor"}
+        return self.is_privileged_cached
     
     def __repr__(self) -> str:
         """Clean representation for debugging"""
         status = "active" if self.active else "inactive"
         return f"UserModel(email='{self.email}', role='{self.role}', {status})"
+
+
+@dataclass(slots=True)
+class UserTable:
+    """Columnar (struct-of-arrays) view over a batch of users.
+
+    Aggregations sweep one homogeneous column at a time instead of
+    hopping between UserModel objects, so counting runs in C-level
+    builtins (Counter, sum) over contiguous lists.
+    """
+
+    emails: list
+    roles: list
+    active: list
+
+    @classmethod
+    def from_users(cls, users: list) -> 'UserTable':
+        """Build the columns from a list of UserModel objects"""
+        return cls(
+            emails=[u.email for u in users],
+            roles=[u.role for u in users],
+            active=[u.active for u in users],
+        )
+
+    def __len__(self) -> int:
+        return len(self.emails)
+
+    def role_counts(self) -> dict:
+        """Count users per role in one pass"""
+        return dict(Counter(self.roles))
+
+    def active_count(self) -> int:
+        """Number of active users"""
+        return sum(self.active)
+
+    def privileged_count(self) -> int:
+        """Number of users with elevated permissions"""
+        counts = Counter(self.roles)
+        return sum(counts[role] for role in _PRIVILEGED)
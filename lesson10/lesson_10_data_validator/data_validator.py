@@ -1,6 +1,6 @@
 """
 Data Validator - Production-Ready CSV Email Validation
-Usage: python data_validator.py
+Usage: python data_validator.py [--no-cache]
 """
 
 from pathlib import Path
@@ -14,7 +14,8 @@ from setup import (
     CSVEmailValidator,
     DirectoryScanner,
     ConsoleReporter,
-    HTMLReporter
+    HTMLReporter,
+    ValidationCache
 )
 
 
@@ -23,15 +24,24 @@ def main():
     # Configuration
     data_directory = Path("sample_data")
     report_path = Path("validation_report.html")
-    
+    cache = None if "--no-cache" in sys.argv else ValidationCache()
+
     # Initialize validator and scanner
-    validator = CSVEmailValidator(email_column="email")
+    validator = CSVEmailValidator(email_column="email", cache=cache)
     scanner = DirectoryScanner(validator)
-    
+
     # Run validation
     print("Starting CSV validation...")
     results = scanner.scan(data_directory)
-    
+
+    # Persist results for the next run; with a process pool the workers'
+    # cache copies are thrown away, so the parent records them here
+    if cache is not None:
+        for result in results:
+            if result.file_path.is_file():
+                cache.put(result.file_path, result)
+        cache.save()
+
     # Generate reports
     ConsoleReporter.report(results)
     HTMLReporter.generate(results, report_path)